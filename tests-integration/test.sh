@@ -2,17 +2,45 @@
 
 set -e
 
-# Function to cleanup processes
-cleanup() {
-    echo "🧹 Cleaning up processes..."
-    for pid in $CSV_PID $TRANSACTION_PID $PARQUET_PID $RBAC_PID $SSL_PID $POSTGIS_PID $FDW_PID; do
+# wait -n -p and EPOCHREALTIME, used to track the servers below, need bash 5.1+
+if [ "${BASH_VERSINFO[0]}" -lt 5 ] || { [ "${BASH_VERSINFO[0]}" -eq 5 ] && [ "${BASH_VERSINFO[1]}" -lt 1 ]; }; then
+    echo "❌ test.sh requires bash 5.1 or newer, found $BASH_VERSION"
+    exit 1
+fi
+
+# Function to cleanup the servers started by a test suite
+cleanup_servers() {
+    for pid in $CSV_PID $PARQUET_PID $RBAC_PID $SSL_PID $POSTGIS_PID; do
         if [ ! -z "$pid" ]; then
             kill -9 $pid 2>/dev/null || true
         fi
     done
+}
+
+# Function to cleanup processes
+cleanup() {
+    echo "🧹 Cleaning up processes..."
+    # Suites still in SUITE_PIDS have not had their output replayed yet, e.g.
+    # because the run was interrupted; print what they logged so far
+    for suite in "${!SUITE_PIDS[@]}"; do
+        kill ${SUITE_PIDS[$suite]} 2>/dev/null || true
+        echo ""
+        echo "--- Output of unfinished suite: $suite ---"
+        cat "$LOG_DIR/$suite.log" 2>/dev/null || true
+    done
+    if [ ! -z "$FDW_CONTAINER_START_PID" ]; then
+        wait $FDW_CONTAINER_START_PID 2>/dev/null || true
+        FDW_PG_CONTAINER=$(cat "$LOG_DIR/fdw-container.id" 2>/dev/null || true)
+    fi
+    # The container is shared with the suite subshells, so only the main
+    # shell removes it
     if [ ! -z "$FDW_PG_CONTAINER" ]; then
         podman rm -f $FDW_PG_CONTAINER 2>/dev/null || true
     fi
+    cleanup_servers
+    if [ ! -z "$LOG_DIR" ]; then
+        rm -rf "$LOG_DIR"
+    fi
 }
 
 # Trap to cleanup on exit
@@ -35,201 +63,299 @@ wait_for_port() {
     done
 }
 
+# Function to wait until a server is accepting connections on a port,
+# printing the tail of its log if it exits or times out first
+wait_for_server() {
+    local port=$1
+    local pid=$2
+    local log=$3
+    local delay_ms=10
+    local delay
+    local deadline_us=$((${EPOCHREALTIME/[.,]/} + 15000000))
+
+    # Redirecting the : builtin opens and closes the probe connection in this
+    # shell rather than in a ( exec ... ) subshell, which removes the fork
+    # for the probe. The backoff sleep below is still one fork per attempt.
+    while ! : 2>/dev/null 3<>/dev/tcp/127.0.0.1/$port; do
+        if [ ${EPOCHREALTIME/[.,]/} -ge $deadline_us ]; then
+            echo "❌ Server on port $port not ready after 15s"
+            tail -n 50 "$log" 2>/dev/null || true
+            exit 1
+        fi
+        # Back off by 1.5x from 10ms up to 500ms between probes. The
+        # delay runs in the background so that wait -n also wakes up as soon
+        # as the server exits, and reports which of the two finished along
+        # with its exit status. printf -v formats the delay without the
+        # extra fork of a command substitution.
+        printf -v delay '%d.%03d' $((delay_ms / 1000)) $((delay_ms % 1000))
+        sleep "$delay" &
+        local sleep_pid=$!
+        local exited_pid=""
+        local status=0
+        wait -n -p exited_pid $sleep_pid $pid || status=$?
+        if [ "$exited_pid" = "$pid" ]; then
+            kill $sleep_pid 2>/dev/null || true
+            wait $sleep_pid 2>/dev/null || true
+            echo "❌ Server on port $port exited with status $status before accepting connections"
+            tail -n 50 "$log" 2>/dev/null || true
+            exit 1
+        fi
+        delay_ms=$((delay_ms * 3 / 2 > 500 ? 500 : delay_ms * 3 / 2))
+    done
+}
+
+# Function to stop a server, escalating to SIGKILL if it is still running
+# after 2s
+stop_server() {
+    local pid=$1
+    local attempts=200
+
+    kill -TERM $pid 2>/dev/null || return 0
+    while kill -0 $pid 2>/dev/null; do
+        if [ $attempts -le 0 ]; then
+            kill -KILL $pid 2>/dev/null || true
+            break
+        fi
+        sleep 0.01
+        attempts=$((attempts - 1))
+    done
+    wait $pid 2>/dev/null || true
+}
+
 echo "🚀 Running DataFusion PostgreSQL Integration Tests"
 echo "=================================================="
 
-# Build the project
-echo "Building datafusion-postgres..."
-cd ..
-cargo build --features datafusion-postgres/postgis
-cd tests-integration
+LOG_DIR=$(mktemp -d)
 
-# Test 1: CSV data loading and PostgreSQL compatibility
-echo ""
-echo "📊 Test 1: Enhanced CSV Data Loading & PostgreSQL Compatibility"
-echo "----------------------------------------------------------------"
-wait_for_port 5433
-../target/debug/datafusion-postgres-cli -p 5433 --csv delhi:delhiclimate.csv &
-CSV_PID=$!
-sleep 5
-
-# Check if server is actually running
-if ! ps -p $CSV_PID > /dev/null 2>&1; then
-    echo "❌ Server failed to start"
-    exit 1
-fi
-
-if python test_csv.py; then
-    echo "✅ Enhanced CSV test passed"
+# Start the PostgreSQL container for the FDW test in the background, so that
+# pulling and starting it overlaps with the build and the other suites. The
+# exit status of podman is written last, which tells the CSV suite (a
+# separate subshell that cannot wait on this job) when start-up is done.
+echo "Starting PostgreSQL container..."
+(
+    status=0
+    podman run -d \
+        -e POSTGRES_USER=postgres \
+        -e POSTGRES_DB=fdw_test \
+        -e POSTGRES_HOST_AUTH_METHOD=trust \
+        -p 5435:5432 \
+        docker.io/library/postgres:17 \
+        > "$LOG_DIR/fdw-container.id" 2> "$LOG_DIR/fdw-container.log" || status=$?
+    echo $status > "$LOG_DIR/fdw-container.status.tmp"
+    mv "$LOG_DIR/fdw-container.status.tmp" "$LOG_DIR/fdw-container.status"
+) &
+FDW_CONTAINER_START_PID=$!
+
+# Build the project unless DF_CLI already points at a prebuilt binary; only
+# the CLI binary is needed to run the tests
+if [ -z "$DF_CLI" ]; then
+    echo "Building datafusion-postgres..."
+    cd ..
+    cargo build -p datafusion-postgres-cli --features datafusion-postgres/postgis
+    cd tests-integration
 else
-    echo "❌ Enhanced CSV test failed"
-    kill -9 $CSV_PID 2>/dev/null || true
-    exit 1
+    echo "Using prebuilt datafusion-postgres-cli: $DF_CLI"
 fi
 
-kill -9 $CSV_PID 2>/dev/null || true
-sleep 3
+# All tests run the same binary rather than going through cargo again
+export DF_CLI=${DF_CLI:-../target/debug/datafusion-postgres-cli}
 
-# Test 2: Foreign Data Wrapper (postgres_fdw)
-echo ""
-echo "🌍 Test 2: Foreign Data Wrapper (postgres_fdw)"
-echo "-----------------------------------------------"
+run_csv_suite() {
+    # A single CSV-backed server on port 5433 is shared by the CSV, FDW and
+    # transaction tests. It listens on all interfaces so that the FDW test's
+    # PostgreSQL container can reach it.
+    wait_for_port 5433
+    $DF_CLI --host 0.0.0.0 -p 5433 --csv delhi:delhiclimate.csv > "$LOG_DIR/csv-server.log" 2>&1 &
+    CSV_PID=$!
+    wait_for_server 5433 $CSV_PID "$LOG_DIR/csv-server.log"
 
-# Start a PostgreSQL container for the FDW test
-echo "Starting PostgreSQL container..."
-FDW_PG_CONTAINER=$(podman run -d \
-    -e POSTGRES_USER=postgres \
-    -e POSTGRES_DB=fdw_test \
-    -e POSTGRES_HOST_AUTH_METHOD=trust \
-    -p 5435:5432 \
-    docker.io/library/postgres:17)
-
-if [ -z "$FDW_PG_CONTAINER" ]; then
-    echo "⚠️  Could not start PostgreSQL container, skipping FDW test"
-else
-    echo "Waiting for PostgreSQL container to be ready..."
-    timeout=60
-    count=0
-    until pg_isready -h 127.0.0.1 -p 5435 -q 2>/dev/null; do
-        if [ $count -ge $timeout ]; then
-            echo "❌ PostgreSQL container did not become ready within ${timeout}s"
-            echo "--- podman logs ---"
-            podman logs $FDW_PG_CONTAINER 2>&1 || true
-            echo "--- end logs ---"
-            podman rm -f $FDW_PG_CONTAINER 2>/dev/null || true
-            FDW_PG_CONTAINER=""
+    # Test 1: CSV data loading and PostgreSQL compatibility
+    echo ""
+    echo "📊 Test 1: Enhanced CSV Data Loading & PostgreSQL Compatibility"
+    echo "----------------------------------------------------------------"
+
+    if python test_csv.py; then
+        echo "✅ Enhanced CSV test passed"
+    else
+        echo "❌ Enhanced CSV test failed"
+        tail -n 50 "$LOG_DIR/csv-server.log" 2>/dev/null || true
+        stop_server $CSV_PID
+        exit 1
+    fi
+
+    # Test 2: Foreign Data Wrapper (postgres_fdw)
+    echo ""
+    echo "🌍 Test 2: Foreign Data Wrapper (postgres_fdw)"
+    echo "-----------------------------------------------"
+
+    # Wait for the container start-up launched before the build
+    while [ ! -f "$LOG_DIR/fdw-container.status" ]; do
+        if ! kill -0 $FDW_CONTAINER_START_PID 2>/dev/null && [ ! -f "$LOG_DIR/fdw-container.status" ]; then
+            echo "❌ PostgreSQL container start-up was interrupted"
+            stop_server $CSV_PID
             exit 1
         fi
-        sleep 1
-        count=$((count + 1))
+        sleep 0.1
     done
-    echo "  PostgreSQL container is ready (waited ${count}s)"
+    if [ "$(cat "$LOG_DIR/fdw-container.status")" != 0 ]; then
+        echo "❌ Could not start PostgreSQL container"
+        cat "$LOG_DIR/fdw-container.log"
+        stop_server $CSV_PID
+        exit 1
+    fi
+    FDW_PG_CONTAINER=$(cat "$LOG_DIR/fdw-container.id")
 
-    # Start datafusion-postgres with CSV data for FDW target
-    wait_for_port 5433
-    ../target/debug/datafusion-postgres-cli --host 0.0.0.0 -p 5433 --csv delhi:delhiclimate.csv &
-    FDW_PID=$!
-    sleep 5
+    if [ -z "$FDW_PG_CONTAINER" ]; then
+        echo "⚠️  Could not start PostgreSQL container, skipping FDW test"
+    else
+        echo "Waiting for PostgreSQL container to be ready..."
+        timeout=60
+        count=0
+        until pg_isready -h 127.0.0.1 -p 5435 -q 2>/dev/null; do
+            if [ $count -ge $timeout ]; then
+                echo "❌ PostgreSQL container did not become ready within ${timeout}s"
+                echo "--- podman logs ---"
+                podman logs $FDW_PG_CONTAINER 2>&1 || true
+                echo "--- end logs ---"
+                podman rm -f $FDW_PG_CONTAINER 2>/dev/null || true
+                FDW_PG_CONTAINER=""
+                exit 1
+            fi
+            sleep 1
+            count=$((count + 1))
+        done
+        echo "  PostgreSQL container is ready (waited ${count}s)"
+
+        # Run FDW test
+        export PGHOST=127.0.0.1
+        export PGPORT=5435
+        export PGUSER=postgres
+        export PGDATABASE=fdw_test
+        export DF_PORT=5433
+
+        if python test_fdw.py; then
+            echo "✅ FDW test passed"
+        else
+            echo "❌ FDW test failed"
+            tail -n 50 "$LOG_DIR/csv-server.log" 2>/dev/null || true
+            stop_server $CSV_PID
+            podman rm -f $FDW_PG_CONTAINER 2>/dev/null || true
+            exit 1
+        fi
 
-    if ! ps -p $FDW_PID > /dev/null 2>&1; then
-        echo "❌ DataFusion server for FDW test failed to start"
         podman rm -f $FDW_PG_CONTAINER 2>/dev/null || true
-        exit 1
+        FDW_PG_CONTAINER=""
     fi
 
-    # Run FDW test
-    export PGHOST=127.0.0.1
-    export PGPORT=5435
-    export PGUSER=postgres
-    export PGDATABASE=fdw_test
-    export DF_PORT=5433
+    # Test 3: Transaction support
+    echo ""
+    echo "🔐 Test 3: Transaction Support"
+    echo "------------------------------"
 
-    if python test_fdw.py; then
-        echo "✅ FDW test passed"
+    if python test_transactions.py; then
+        echo "✅ Transaction test passed"
     else
-        echo "❌ FDW test failed"
-        kill -9 $FDW_PID 2>/dev/null || true
-        podman rm -f $FDW_PG_CONTAINER 2>/dev/null || true
+        echo "❌ Transaction test failed"
+        tail -n 50 "$LOG_DIR/csv-server.log" 2>/dev/null || true
+        stop_server $CSV_PID
         exit 1
     fi
 
-    kill -9 $FDW_PID 2>/dev/null || true
-    podman rm -f $FDW_PG_CONTAINER 2>/dev/null || true
-    FDW_PG_CONTAINER=""
-    sleep 3
-fi
-
-# Test 3: Transaction support
-echo ""
-echo "🔐 Test 3: Transaction Support"
-echo "------------------------------"
-wait_for_port 5433
-../target/debug/datafusion-postgres-cli -p 5433 --csv delhi:delhiclimate.csv &
-TRANSACTION_PID=$!
-sleep 5
-
-if python test_transactions.py; then
-    echo "✅ Transaction test passed"
-else
-    echo "❌ Transaction test failed"
-    kill -9 $TRANSACTION_PID 2>/dev/null || true
-    exit 1
-fi
+    stop_server $CSV_PID
+}
 
-kill -9 $TRANSACTION_PID 2>/dev/null || true
-sleep 3
+run_parquet_suite() {
+    # Test 4: Parquet data loading and advanced data types
+    echo ""
+    echo "📦 Test 4: Enhanced Parquet Data Loading & Advanced Data Types"
+    echo "--------------------------------------------------------------"
+    wait_for_port 5434
+    $DF_CLI -p 5434 --parquet all_types:all_types.parquet > "$LOG_DIR/parquet-server.log" 2>&1 &
+    PARQUET_PID=$!
+    wait_for_server 5434 $PARQUET_PID "$LOG_DIR/parquet-server.log"
+
+    if python test_parquet.py; then
+        echo "✅ Enhanced Parquet test passed"
+    else
+        echo "❌ Enhanced Parquet test failed"
+        tail -n 50 "$LOG_DIR/parquet-server.log" 2>/dev/null || true
+        stop_server $PARQUET_PID
+        exit 1
+    fi
 
-# Test 4: Parquet data loading and advanced data types
-echo ""
-echo "📦 Test 4: Enhanced Parquet Data Loading & Advanced Data Types"
-echo "--------------------------------------------------------------"
-wait_for_port 5434
-../target/debug/datafusion-postgres-cli -p 5434 --parquet all_types:all_types.parquet &
-PARQUET_PID=$!
-sleep 5
-
-if python test_parquet.py; then
-    echo "✅ Enhanced Parquet test passed"
-else
-    echo "❌ Enhanced Parquet test failed"
-    kill -9 $PARQUET_PID 2>/dev/null || true
-    exit 1
-fi
+    stop_server $PARQUET_PID
+}
 
-kill -9 $PARQUET_PID 2>/dev/null || true
-sleep 3
+run_ssl_suite() {
+    # Test 5: SSL/TLS Security
+    echo ""
+    echo "🔒 Test 5: SSL/TLS Security Features"
+    echo "------------------------------------"
+    wait_for_port 5436
+    $DF_CLI -p 5436 --csv delhi:delhiclimate.csv > "$LOG_DIR/ssl-server.log" 2>&1 &
+    SSL_PID=$!
+    wait_for_server 5436 $SSL_PID "$LOG_DIR/ssl-server.log"
+
+    if python test_ssl.py; then
+        echo "✅ SSL/TLS test passed"
+    else
+        echo "❌ SSL/TLS test failed"
+        tail -n 50 "$LOG_DIR/ssl-server.log" 2>/dev/null || true
+        stop_server $SSL_PID
+        exit 1
+    fi
 
-# Test 5: SSL/TLS Security
-echo ""
-echo "🔒 Test 5: SSL/TLS Security Features"
-echo "------------------------------------"
-wait_for_port 5436
-../target/debug/datafusion-postgres-cli -p 5436 --csv delhi:delhiclimate.csv &
-SSL_PID=$!
-sleep 5
-
-# Check if server is actually running
-if ! ps -p $SSL_PID > /dev/null 2>&1; then
-    echo "❌ SSL server failed to start"
-    exit 1
-fi
+    stop_server $SSL_PID
+}
 
-if python test_ssl.py; then
-    echo "✅ SSL/TLS test passed"
-else
-    echo "❌ SSL/TLS test failed"
-    kill -9 $SSL_PID 2>/dev/null || true
-    exit 1
-fi
+run_postgis_suite() {
+    # Test 6: PostGIS Spatial Functions
+    echo ""
+    echo "🗺️  Test 6: PostGIS Spatial Functions"
+    echo "--------------------------------------"
+    wait_for_port 5437
+    $DF_CLI -p 5437 --csv delhi:delhiclimate.csv > "$LOG_DIR/postgis-server.log" 2>&1 &
+    POSTGIS_PID=$!
+    wait_for_server 5437 $POSTGIS_PID "$LOG_DIR/postgis-server.log"
+
+    if python test_postgis.py; then
+        echo "✅ PostGIS test passed"
+    else
+        echo "❌ PostGIS test failed"
+        tail -n 50 "$LOG_DIR/postgis-server.log" 2>/dev/null || true
+        stop_server $POSTGIS_PID
+        exit 1
+    fi
 
-kill -9 $SSL_PID 2>/dev/null || true
-sleep 3
+    stop_server $POSTGIS_PID
+}
 
-# Test 6: PostGIS Spatial Functions
-echo ""
-echo "🗺️  Test 6: PostGIS Spatial Functions"
-echo "--------------------------------------"
-wait_for_port 5437
-../target/debug/datafusion-postgres-cli -p 5437 --csv delhi:delhiclimate.csv &
-POSTGIS_PID=$!
-sleep 5
-
-# Check if server is actually running
-if ! ps -p $POSTGIS_PID > /dev/null 2>&1; then
-    echo "❌ PostGIS server failed to start"
-    exit 1
-fi
+# The suites below use disjoint ports, so they run concurrently. Each one
+# logs to its own file, which is replayed as soon as the suite and the ones
+# before it have finished, or by cleanup if the run is interrupted.
+SUITES="csv parquet ssl postgis"
+declare -A SUITE_PIDS
+
+for suite in $SUITES; do
+    ( trap cleanup_servers EXIT; run_${suite}_suite ) > "$LOG_DIR/$suite.log" 2>&1 &
+    SUITE_PIDS[$suite]=$!
+done
+
+FAILED_SUITES=""
+for suite in $SUITES; do
+    if ! wait ${SUITE_PIDS[$suite]}; then
+        FAILED_SUITES="$FAILED_SUITES $suite"
+    fi
+    cat "$LOG_DIR/$suite.log"
+    unset "SUITE_PIDS[$suite]"
+done
 
-if python test_postgis.py; then
-    echo "✅ PostGIS test passed"
-else
-    echo "❌ PostGIS test failed"
-    kill -9 $POSTGIS_PID 2>/dev/null || true
+if [ -n "$FAILED_SUITES" ]; then
+    echo ""
+    echo "❌ Failed suites:$FAILED_SUITES"
     exit 1
 fi
 
-kill -9 $POSTGIS_PID 2>/dev/null || true
-
 echo ""
 echo "🎉 All enhanced integration tests passed!"
 echo "=========================================="
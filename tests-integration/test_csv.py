@@ -6,7 +6,7 @@ import psycopg
 def main():
     print("🔍 Testing CSV data loading and PostgreSQL compatibility...")
 
-    conn = psycopg.connect("host=127.0.0.1 port=5433 user=postgres dbname=public")
+    conn = psycopg.connect("host=127.0.0.1 port=5433 user=postgres dbname=public connect_timeout=5 application_name=test_csv")
     conn.autocommit = True
 
     with conn.cursor() as cur:
@@ -30,15 +30,19 @@ def main():
 
 def test_basic_data_access(cur):
     """Test basic data access and queries."""
+    # The count and limit queries are independent, so send them in one pipeline
+    conn = cur.connection
+    with conn.pipeline():
+        count_cur = conn.execute("SELECT count(*) FROM delhi")
+        limit_cur = conn.execute("SELECT * FROM delhi ORDER BY date LIMIT 10")
+
     # Test basic count
-    cur.execute("SELECT count(*) FROM delhi")
-    results = cur.fetchone()
+    results = count_cur.fetchone()
     assert results[0] == 1462
     print(f"  ✓ Delhi dataset count: {results[0]} rows")
 
     # Test basic query with limit
-    cur.execute("SELECT * FROM delhi ORDER BY date LIMIT 10")
-    results = cur.fetchall()
+    results = limit_cur.fetchall()
     assert len(results) == 10
     print(f"  ✓ Limited query: {len(results)} rows")
 
@@ -79,27 +83,31 @@ def test_enhanced_pg_catalog(cur):
 
 def test_postgresql_functions(cur):
     """Test PostgreSQL compatibility functions."""
+    # The function probes are independent, so send them in a single pipeline
+    conn = cur.connection
+    with conn.pipeline():
+        version_cur = conn.execute("SELECT version()")
+        schema_cur = conn.execute("SELECT current_schema()")
+        schemas_cur = conn.execute("SELECT current_schemas(false)")
+        privilege_cur = conn.execute("SELECT has_table_privilege('delhi', 'SELECT')")
+
     # Test version function
-    cur.execute("SELECT version()")
-    version = cur.fetchone()[0]
+    version = version_cur.fetchone()[0]
     assert "DataFusion" in version
     print(f"  ✓ version(): {version[:50]}...")
 
     # Test current_schema function
-    cur.execute("SELECT current_schema()")
-    schema = cur.fetchone()[0]
+    schema = schema_cur.fetchone()[0]
     assert schema == "public"
     print(f"  ✓ current_schema(): {schema}")
 
     # Test current_schemas function
-    cur.execute("SELECT current_schemas(false)")
-    schemas = cur.fetchone()[0]
+    schemas = schemas_cur.fetchone()[0]
     assert "public" in schemas
     print(f"  ✓ current_schemas(): {schemas}")
 
     # Test has_table_privilege function (2-parameter version)
-    cur.execute("SELECT has_table_privilege('delhi', 'SELECT')")
-    result = cur.fetchone()[0]
+    result = privilege_cur.fetchone()[0]
     assert isinstance(result, bool)
     print(f"  ✓ has_table_privilege(): {result}")
 
@@ -10,6 +10,7 @@ The datafusion-postgres server should be running on port specified by DF_PORT (d
 
 import os
 import sys
+import traceback
 import psycopg
 
 
@@ -26,7 +27,8 @@ def main():
 
     try:
         conn = psycopg.connect(
-            f"host={PG_HOST} port={PG_PORT} user={PG_USER} dbname={PG_DB}",
+            f"host={PG_HOST} port={PG_PORT} user={PG_USER} dbname={PG_DB} "
+            "connect_timeout=5 application_name=test_fdw",
             autocommit=True,
         )
         pg_version = conn.info.server_version
@@ -46,7 +48,6 @@ def main():
 
     except Exception as e:
         print(f"\n❌ FDW tests failed: {e}")
-        import traceback
         traceback.print_exc()
         return 1
 
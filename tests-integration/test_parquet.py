@@ -6,7 +6,7 @@ import psycopg
 def main():
     print("🔍 Testing Parquet data loading and advanced data types...")
     
-    conn = psycopg.connect("host=127.0.0.1 port=5434 user=postgres dbname=public")
+    conn = psycopg.connect("host=127.0.0.1 port=5434 user=postgres dbname=public connect_timeout=5 application_name=test_parquet")
     conn.autocommit = True
 
     with conn.cursor() as cur:
@@ -33,20 +33,24 @@ def main():
 
 def test_basic_parquet_data(cur):
     """Test basic Parquet data access."""
+    # The queries are independent, so send them in one pipeline
+    conn = cur.connection
+    with conn.pipeline():
+        count_cur = conn.execute("SELECT count(*) FROM all_types")
+        limit_cur = conn.execute("SELECT * FROM all_types LIMIT 1")
+        all_cur = conn.execute("SELECT * FROM all_types")
+
     # Test basic count
-    cur.execute("SELECT count(*) FROM all_types")
-    results = cur.fetchone()
+    results = count_cur.fetchone()
     assert results[0] == 3
     print(f"  ✓ all_types dataset count: {results[0]} rows")
 
     # Test basic data retrieval
-    cur.execute("SELECT * FROM all_types LIMIT 1")
-    results = cur.fetchall()
+    results = limit_cur.fetchall()
     print(f"  ✓ Basic data retrieval: {len(results)} rows")
     
     # Test that we can access all rows
-    cur.execute("SELECT * FROM all_types")
-    all_results = cur.fetchall()
+    all_results = all_cur.fetchall()
     assert len(all_results) == 3
     print(f"  ✓ Full data access: {len(all_results)} rows")
 
@@ -11,7 +11,7 @@ def main():
     print("🗺️  Testing PostGIS Spatial Queries")
     print("=" * 50)
 
-    conn = psycopg.connect("host=127.0.0.1 port=5437 user=postgres dbname=public")
+    conn = psycopg.connect("host=127.0.0.1 port=5437 user=postgres dbname=public connect_timeout=5 application_name=test_postgis")
     conn.autocommit = True
 
     with conn.cursor() as cur:
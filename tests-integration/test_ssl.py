@@ -7,27 +7,30 @@ import psycopg
 import ssl
 import sys
 import subprocess
-import time
 import os
 
+DF_CLI = os.environ.get("DF_CLI", "../target/debug/datafusion-postgres-cli")
+
 def test_ssl_tls():
     """Test SSL/TLS encryption support"""
     print("🔐 Testing SSL/TLS Encryption")
     print("==============================")
     
+    conn = None
     try:
         print("\n📋 Test 1: Unencrypted Connection (Default)")
         
-        # Test unencrypted connection works
-        with psycopg.connect("host=127.0.0.1 port=5436 user=postgres") as conn:
-            with conn.cursor() as cur:
-                cur.execute("SELECT COUNT(*) FROM delhi")
-                count = cur.fetchone()[0]
-                print(f"  ✓ Unencrypted connection: {count} rows")
-                
-                # Check connection info
-                print(f"  ✓ Connection established to {conn.info.host}:{conn.info.port}")
-                
+        # Test unencrypted connection works; the same connection is reused below
+        conn = psycopg.connect("host=127.0.0.1 port=5436 user=postgres connect_timeout=5 application_name=test_ssl")
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute("SELECT COUNT(*) FROM delhi")
+            count = cur.fetchone()[0]
+            print(f"  ✓ Unencrypted connection: {count} rows")
+            
+            # Check connection info
+            print(f"  ✓ Connection established to {conn.info.host}:{conn.info.port}")
+            
         print("\n🔒 Test 2: SSL/TLS Configuration Status")
         
         # Test that we can check SSL availability
@@ -43,28 +46,28 @@ def test_ssl_tls():
             
         print("\n🌐 Test 3: Connection Security Information")
         
-        # Test connection security information
-        with psycopg.connect("host=127.0.0.1 port=5436 user=postgres") as conn:
-            with conn.cursor() as cur:
-                
-                # Test system information
-                cur.execute("SELECT version()")
-                version = cur.fetchone()[0]
-                print(f"  ✓ Server version: {version[:60]}...")
-                
-                # Test that authentication is working
-                cur.execute("SELECT current_schema()")
-                schema = cur.fetchone()[0]
-                print(f"  ✓ Current schema: {schema}")
-                
-                print("  ✓ Connection security validated")
+        # Test connection security information; both probes are sent in
+        # one pipeline on the shared connection
+        with conn.pipeline():
+            version_cur = conn.execute("SELECT version()")
+            schema_cur = conn.execute("SELECT current_schema()")
+            
+        # Test system information
+        version = version_cur.fetchone()[0]
+        print(f"  ✓ Server version: {version[:60]}...")
+        
+        # Test that authentication is working
+        schema = schema_cur.fetchone()[0]
+        print(f"  ✓ Current schema: {schema}")
+        
+        print("  ✓ Connection security validated")
                 
         print("\n🔧 Test 4: SSL/TLS Feature Availability")
         
         # Check if the server binary supports TLS options
         result = subprocess.run([
-            "../target/debug/datafusion-postgres-cli", "--help"
-        ], capture_output=True, text=True, cwd=".")
+            DF_CLI, "--help"
+        ], capture_output=True, text=True, cwd=".", timeout=10)
         
         if "--tls-cert" in result.stdout and "--tls-key" in result.stdout:
             print("  ✓ TLS command-line options available")
@@ -111,6 +114,9 @@ def test_ssl_tls():
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
         return False
+    finally:
+        if conn is not None:
+            conn.close()
     
     return True
 
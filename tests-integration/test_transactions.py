@@ -12,7 +12,7 @@ def main():
     print("=" * 50)
     
     try:
-        conn = psycopg.connect('host=127.0.0.1 port=5433 user=postgres dbname=public')
+        conn = psycopg.connect('host=127.0.0.1 port=5433 user=postgres dbname=public connect_timeout=5 application_name=test_transactions')
         conn.autocommit = True
         
         print("\n📝 Test 1: Basic Transaction Lifecycle")